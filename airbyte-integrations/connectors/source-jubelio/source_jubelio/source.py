@@ -2,15 +2,42 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, List, Mapping, Tuple
+from datetime import timedelta
+from typing import Any, List, Mapping, Optional, Tuple
 import logging
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from airbyte_cdk.models import AirbyteConnectionStatus, Status
 from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams.call_rate import HttpAPIBudget, MovingWindowCallRatePolicy, Rate
 
-from .streams import JubelioStream, Products, Orders
+from .streams import JubelioConfig, JubelioStream, Products, Orders
+
+
+# Shared keep-alive session so repeated connection checks reuse pooled TCP/TLS connections.
+# Transient error statuses are retried with a capped exponential backoff. Retry-After is ignored
+# because urllib3 sleeps for whatever the server asks, which would leave the check unbounded.
+# Connect and read errors are raised at once, so timeouts still surface as requests Timeout.
+_RETRY = Retry(
+    total=5,
+    connect=False,
+    read=False,
+    status_forcelist=[429, 500, 502, 503, 504],
+    backoff_factor=0.5,
+    backoff_max=4,
+    respect_retry_after_header=False,
+    raise_on_status=False,
+)
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=_RETRY)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+CHECK_TIMEOUT = 30
 
 
 class SourceJubelio(AbstractSource):
@@ -18,6 +45,12 @@ class SourceJubelio(AbstractSource):
     Source implementation for Jubelio API.
     """
 
+    def __init__(self):
+        super().__init__()
+        # Streams built for the last config, reused while the config is unchanged
+        self._streams: Optional[List[Stream]] = None
+        self._streams_config: Optional[JubelioConfig] = None
+
     def check_connection(self, logger: logging.Logger, config: Mapping[str, Any]) -> Tuple[bool, Any]:
         """
         Check if the provided configuration can be used to connect to the underlying API
@@ -38,24 +71,22 @@ class SourceJubelio(AbstractSource):
                     return False, f"Missing required configuration field: {field}"
             
             # Test actual API connection using a lightweight endpoint
-            base_url = config.get("base_url", "https://api2.jubelio.com")
-            api_key = config.get("api_key")
-            
-            # Remove trailing slash if present
-            base_url = base_url.rstrip("/")
+            jubelio_config = JubelioConfig.from_config(config)
+            base_url = jubelio_config.base_url
             
             # Use the inventory categories endpoint as it's lightweight for connection testing
             test_url = f"{base_url}/inventory/categories/item-categories/"
             
             headers = {
-                "authorization": api_key,  # Based on OpenAPI spec - direct token, not Bearer
+                "authorization": jubelio_config.api_key,  # Based on OpenAPI spec - direct token, not Bearer
                 "Content-Type": "application/json",
+                "Accept": "application/json",
             }
             
             logger.info(f"Testing connection to Jubelio API at {test_url}")
             
-            # Make test request with timeout
-            response = requests.get(test_url, headers=headers, timeout=30)
+            # Make test request with timeout, fetching a single record to keep the body small
+            response = _SESSION.get(test_url, headers=headers, params={"pageSize": 1}, timeout=CHECK_TIMEOUT)
             
             # Check for authentication errors
             if response.status_code == 401:
@@ -69,16 +100,14 @@ class SourceJubelio(AbstractSource):
             if response.status_code == 404:
                 return False, f"API endpoint not found. Please verify the base_url: {base_url}"
             
-            # Check for server errors
-            if response.status_code >= 500:
-                return False, f"Server error from Jubelio API: {response.status_code}"
-            
-            # Check for other client errors
+            # Any other error status, including server errors still failing after retries
             if response.status_code >= 400:
                 try:
-                    error_data = response.json()
+                    error_data = orjson.loads(response.content)
                     error_message = error_data.get("message", f"API error: {response.status_code}")
                 except:
+                    # The API answers in UTF-8, so skip charset detection when decoding the text
+                    response.encoding = "utf-8"
                     error_message = f"API error: {response.status_code} - {response.text[:200]}"
                 return False, error_message
             
@@ -109,8 +138,36 @@ class SourceJubelio(AbstractSource):
         Returns:
             List of streams
         """
+        jubelio_config = JubelioConfig.from_config(config)
+        if self._streams is not None and self._streams_config == jubelio_config:
+            return self._streams
+
+        # One budget for all streams, as Jubelio enforces its quota per API key
+        api_budget = self._api_budget(jubelio_config)
         # TODO: Add your actual streams here
-        return [
-            Products(config=config),
-            Orders(config=config),
-        ]
\ No newline at end of file
+        self._streams = [
+            Products(config=jubelio_config, api_budget=api_budget),
+            Orders(config=jubelio_config, api_budget=api_budget),
+        ]
+        self._streams_config = jubelio_config
+        return self._streams
+
+    @staticmethod
+    def _api_budget(config: JubelioConfig) -> HttpAPIBudget:
+        """
+        Build the call budget that paces requests at the configured rate per second
+
+        Args:
+            config: Parsed connector configuration
+
+        Returns:
+            API budget shared by every stream of the source
+        """
+        return HttpAPIBudget(
+            policies=[
+                MovingWindowCallRatePolicy(
+                    rates=[Rate(limit=config.requests_per_second, interval=timedelta(seconds=1))],
+                    matchers=[],
+                )
+            ]
+        )
\ No newline at end of file
@@ -2,29 +2,81 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any, Iterable, Mapping, Optional
 
+import orjson
 import requests
 from airbyte_cdk.sources.streams.http import HttpStream
 
 
+DEFAULT_BASE_URL = "https://api2.jubelio.com"
+DEFAULT_REQUESTS_PER_SECOND = 10
+
+
+@dataclass(frozen=True, slots=True)
+class JubelioConfig:
+    """
+    Connector configuration parsed once and shared by the source and its streams
+    """
+
+    base_url: str
+    api_key: str
+    requests_per_second: int = DEFAULT_REQUESTS_PER_SECOND
+    start_date: Optional[str] = None
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "JubelioConfig":
+        """
+        Parse the user input configuration, normalizing the base URL
+        """
+        return cls(
+            base_url=config.get("base_url", DEFAULT_BASE_URL).rstrip("/"),
+            api_key=config.get("api_key"),
+            requests_per_second=config.get("requests_per_second", DEFAULT_REQUESTS_PER_SECOND),
+            start_date=config.get("start_date"),
+        )
+
+
 class JubelioStream(HttpStream):
     """
     Base stream class for Jubelio API streams
     """
 
-    def __init__(self, config: Mapping[str, Any], **kwargs):
+    page_size = 100
+    # Constant endpoint path, set by each stream
+    _PATH: str
+
+    def __init__(self, config: JubelioConfig, **kwargs):
         super().__init__(**kwargs)
         self.config = config
-        self.base_url = config.get("base_url", "https://api2.jubelio.com")
-        self.api_key = config.get("api_key")
+        # Headers and base query params are constant per stream, so build them once
+        self._headers = MappingProxyType({
+            "authorization": config.api_key,  # Direct token based on OpenAPI spec
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        })
+        self._base_params = {"pageSize": self.page_size, "page": 1}
+        self._page = 1
+        # Last parsed page, shared by parse_response and next_page_token
+        self._last_response: Optional[requests.Response] = None
+        self._last_response_json: Any = None
 
     @property
     def url_base(self) -> str:
         """
         Returns the base URL for the API
         """
-        return self.base_url
+        return self.config.base_url
+
+    def path(
+        self, stream_state: Mapping[str, Any] = None, stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> str:
+        """
+        Return the API endpoint path of the stream
+        """
+        return self._PATH
 
     def request_headers(
         self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
@@ -32,16 +84,18 @@ class JubelioStream(HttpStream):
         """
         Return headers for API requests
         """
-        return {
-            "authorization": self.api_key,  # Direct token based on OpenAPI spec
-            "Content-Type": "application/json",
-        }
+        return self._headers
 
     def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
         """
-        Return next page token if pagination is supported
-        TODO: Implement based on Jubelio API pagination format
+        Return the next page number while fetched pages are below the response's totalCount
         """
+        response_json = self._response_json(response)
+        # next_page_token is the last reader of the page, so release it instead of keeping it alive
+        self._last_response = self._last_response_json = None
+        total_count = response_json.get("totalCount", 0) if isinstance(response_json, dict) else 0
+        if self._page * self.page_size < total_count:
+            return {"page": self._page + 1}
         return None
 
     def request_params(
@@ -50,14 +104,16 @@ class JubelioStream(HttpStream):
         """
         Return request parameters
         """
-        return {}
+        # Track the page actually requested, including a page resumed from checkpointed state
+        self._page = (next_page_token or {}).get("page", 1)
+        return {**self._base_params, **(next_page_token or {})}
 
     def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
         """
         Parse the response and yield records
         TODO: Implement based on Jubelio API response format
         """
-        response_json = response.json()
+        response_json = self._response_json(response)
         
         # TODO: Modify this based on actual Jubelio API response structure
         if isinstance(response_json, list):
@@ -67,22 +123,24 @@ class JubelioStream(HttpStream):
         else:
             yield response_json
 
+    def _response_json(self, response: requests.Response) -> Any:
+        """
+        Parse the response body, reusing the result when the same page is read twice
+        """
+        if response is not self._last_response:
+            self._last_response = response
+            self._last_response_json = orjson.loads(response.content)
+        return self._last_response_json
+
 
 class Products(JubelioStream):
     """
     Stream for Jubelio products
     """
     
+    _PATH = "products"  # TODO: Update with actual Jubelio API endpoint
     primary_key = "id"
-
-    def path(
-        self, stream_state: Mapping[str, Any] = None, stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
-    ) -> str:
-        """
-        Return the API endpoint path for products
-        TODO: Update with actual Jubelio API endpoint
-        """
-        return "products"
+    name = "products"
 
 
 class Orders(JubelioStream):
@@ -90,13 +148,6 @@ class Orders(JubelioStream):
     Stream for Jubelio orders
     """
     
+    _PATH = "orders"  # TODO: Update with actual Jubelio API endpoint
     primary_key = "id"
-
-    def path(
-        self, stream_state: Mapping[str, Any] = None, stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
-    ) -> str:
-        """
-        Return the API endpoint path for orders
-        TODO: Update with actual Jubelio API endpoint
-        """
-        return "orders"
\ No newline at end of file
+    name = "orders"
\ No newline at end of file
@@ -2,16 +2,62 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+from types import MappingProxyType
+
 import pytest
+from source_jubelio.streams import JubelioConfig
 
 
-@pytest.fixture(name="config")
+@pytest.fixture(name="config", scope="session")
 def config_fixture():
     """
-    Sample configuration for testing
+    Sample configuration for testing, read-only as it is shared by the whole session
     """
-    return {
+    return MappingProxyType({
         "api_key": "test_api_key",
         "base_url": "https://api2.jubelio.com",
         "start_date": "2021-01-01T00:00:00Z"
-    }
\ No newline at end of file
+    })
+
+
+@pytest.fixture(name="jubelio_config", scope="session")
+def jubelio_config_fixture(config):
+    """
+    Parsed configuration passed to streams
+    """
+    return JubelioConfig.from_config(config)
+
+
+@pytest.fixture(name="make_stream", scope="session")
+def make_stream_fixture(jubelio_config):
+    """
+    Factory returning one shared instance per stream class, for tests that do not change stream state
+    """
+    instances = {}
+
+    def make_stream(stream_class):
+        if stream_class not in instances:
+            instances[stream_class] = stream_class(config=jubelio_config)
+        return instances[stream_class]
+
+    return make_stream
+
+
+@pytest.fixture(name="products_response", scope="session")
+def products_response_fixture():
+    """
+    Single page of products served by the mock API
+    """
+    return {
+        "data": [{"id": 1, "item_name": "Kaos Polos"}, {"id": 2, "item_name": "Kemeja Batik"}],
+        "totalCount": 2,
+    }
+
+
+@pytest.fixture(name="mock_api")
+def mock_api_fixture(requests_mock, products_response):
+    """
+    Jubelio API responses served only to the test that requests them
+    """
+    requests_mock.get("https://api2.jubelio.com/products", json=products_response)
+    return requests_mock
\ No newline at end of file
@@ -2,14 +2,48 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
+from airbyte_cdk.sources.streams.call_rate import MovingWindowCallRatePolicy, Rate
 from source_jubelio import SourceJubelio
+from source_jubelio.streams import DEFAULT_REQUESTS_PER_SECOND
+
+
+@pytest.fixture(name="api_server")
+def api_server_fixture():
+    """
+    Local HTTP server answering each request with the next queued (status, headers) pair
+    """
+    responses = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            status, headers = responses.pop(0)
+            self.send_response(status)
+            for name, value in {**headers, "Content-Length": "0"}.items():
+                self.send_header(name, value)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    yield f"http://{host}:{port}", responses
+    server.shutdown()
+    server.server_close()
 
 
 class TestSourceJubelio:
-    @patch('source_jubelio.source.requests.get')
+    @patch('source_jubelio.source._SESSION.get')
     def test_check_connection_success(self, mock_get, config):
         """Test successful connection check"""
         # Mock successful API response
@@ -27,8 +61,9 @@ class TestSourceJubelio:
         args, kwargs = mock_get.call_args
         assert "inventory/categories/item-categories" in args[0]
         assert kwargs['headers']['authorization'] == 'test_api_key'
+        assert kwargs['params'] == {'pageSize': 1}
 
-    @patch('source_jubelio.source.requests.get')
+    @patch('source_jubelio.source._SESSION.get')
     def test_check_connection_auth_failure(self, mock_get, config):
         """Test connection check with authentication failure"""
         # Mock 401 Unauthorized response
@@ -41,6 +76,59 @@ class TestSourceJubelio:
         assert status is False
         assert "Authentication failed" in message
 
+    @patch('source_jubelio.source._SESSION.get')
+    def test_check_connection_error_message(self, mock_get, config):
+        """Test connection check surfaces the API error message"""
+        mock_response = MagicMock()
+        mock_response.status_code = 400
+        mock_response.content = b'{"message": "Invalid page size"}'
+        mock_get.return_value = mock_response
+        
+        source = SourceJubelio()
+        status, message = source.check_connection(MagicMock(), config)
+        assert status is False
+        assert message == "Invalid page size"
+
+    @patch('source_jubelio.source.CHECK_TIMEOUT', 0.2)
+    def test_check_connection_timeout(self, config):
+        """Test connection check reports a timeout from a server that never replies"""
+        with socket.socket() as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen()
+            host, port = server.getsockname()
+            
+            source = SourceJubelio()
+            status, message = source.check_connection(MagicMock(), {**config, "base_url": f"http://{host}:{port}"})
+            assert status is False
+            assert "Connection timeout" in message
+            
+            # The timed out request is not retried
+            server.settimeout(0)
+            server.accept()[0].close()
+            with pytest.raises(BlockingIOError):
+                server.accept()
+
+    def test_check_connection_retries_server_error(self, config, api_server):
+        """Test connection check succeeds when a transient 503 is followed by a 200"""
+        base_url, responses = api_server
+        responses.extend([(503, {}), (200, {})])
+        
+        source = SourceJubelio()
+        status, message = source.check_connection(MagicMock(), {**config, "base_url": base_url})
+        assert (status, message) == (True, None)
+        assert responses == []
+
+    def test_check_connection_ignores_retry_after(self, config, api_server):
+        """Test connection check does not wait for the server's Retry-After"""
+        base_url, responses = api_server
+        responses.extend([(429, {"Retry-After": "2"}), (200, {})])
+        
+        source = SourceJubelio()
+        start = time.monotonic()
+        status, _ = source.check_connection(MagicMock(), {**config, "base_url": base_url})
+        assert status is True
+        assert time.monotonic() - start < 1
+
     def test_check_connection_missing_api_key(self, config):
         """Test connection check with missing API key"""
         config_without_key = config.copy()
@@ -68,4 +156,31 @@ class TestSourceJubelio:
         assert len(streams) == 2
         stream_names = [stream.name for stream in streams]
         assert "products" in stream_names
-        assert "orders" in stream_names
\ No newline at end of file
+        assert "orders" in stream_names
+
+    @pytest.mark.parametrize(
+        "requests_per_second, expected_limit",
+        [(3, 3), (None, DEFAULT_REQUESTS_PER_SECOND)],
+    )
+    def test_streams_share_api_budget(self, config, requests_per_second, expected_limit):
+        """Test that all streams share one budget paced at the configured requests per second"""
+        stream_config = dict(config)
+        if requests_per_second is not None:
+            stream_config["requests_per_second"] = requests_per_second
+        
+        with patch("source_jubelio.source.MovingWindowCallRatePolicy", wraps=MovingWindowCallRatePolicy) as mock_policy:
+            streams = SourceJubelio().streams(stream_config)
+        
+        budgets = {id(stream._http_client._api_budget) for stream in streams}
+        assert len(budgets) == 1
+        mock_policy.assert_called_once()
+        assert mock_policy.call_args.kwargs["rates"] == [Rate(limit=expected_limit, interval=timedelta(seconds=1))]
+
+    def test_streams_reused_for_same_config(self, config):
+        """Test that streams are built once per config"""
+        source = SourceJubelio()
+        streams = source.streams(config)
+        assert source.streams(dict(config)) is streams
+        assert source.streams({**config, "api_key": "other_api_key"}) is not streams
+        streams = source.streams(config)
+        assert source.streams({**config, "start_date": "2022-01-01T00:00:00Z"}) is not streams
\ No newline at end of file
@@ -3,44 +3,88 @@
 #
 
 import pytest
-import requests_mock
-from source_jubelio.streams import JubelioStream, Products, Orders
-
-
-class TestJubelioStream:
-    def test_request_headers(self, config):
-        """Test that request headers include authentication"""
-        stream = JubelioStream(config=config)
-        headers = stream.request_headers({})
-        
-        assert headers["Authorization"] == "Bearer test_api_key"
-        assert headers["Content-Type"] == "application/json"
-
-    def test_url_base(self, config):
-        """Test that URL base is set correctly"""
-        stream = JubelioStream(config=config)
-        assert stream.url_base == "https://api.jubelio.com"
-
-
-class TestProducts:
-    def test_path(self, config):
-        """Test that products stream has correct path"""
-        stream = Products(config=config)
-        assert stream.path() == "products"
-
-    def test_primary_key(self, config):
-        """Test that products stream has correct primary key"""
-        stream = Products(config=config)
-        assert stream.primary_key == "id"
-
-
-class TestOrders:
-    def test_path(self, config):
-        """Test that orders stream has correct path"""
-        stream = Orders(config=config)
-        assert stream.path() == "orders"
-
-    def test_primary_key(self, config):
-        """Test that orders stream has correct primary key"""
-        stream = Orders(config=config)
-        assert stream.primary_key == "id"
\ No newline at end of file
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.types import StreamSlice
+from source_jubelio.streams import JubelioConfig, Products, Orders
+
+
+_EXPECTED_HEADERS = {
+    "authorization": "test_api_key",
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+}
+
+
+def test_request_headers(make_stream):
+    """Test that request headers include authentication"""
+    stream = make_stream(Products)
+    assert stream.request_headers({}) == _EXPECTED_HEADERS
+
+
+def test_url_base(make_stream):
+    """Test that URL base is set correctly"""
+    stream = make_stream(Products)
+    assert stream.url_base == "https://api2.jubelio.com"
+
+
+def test_url_base_trailing_slash(config):
+    """Test that a trailing slash in the configured base URL is removed"""
+    stream = Products(config=JubelioConfig.from_config({**config, "base_url": "https://api2.jubelio.com/"}))
+    assert stream.url_base == "https://api2.jubelio.com"
+
+
+def test_request_params(jubelio_config):
+    """Test that pagination params are merged over the base params"""
+    stream = Products(config=jubelio_config)
+    assert stream.request_params({}) == {"pageSize": 100, "page": 1}
+    assert stream.request_params({}, next_page_token={"page": 3}) == {"pageSize": 100, "page": 3}
+
+
+@pytest.mark.parametrize(
+    "stream_class, path, primary_key, name",
+    [
+        (Products, "products", "id", "products"),
+        (Orders, "orders", "id", "orders"),
+    ],
+)
+def test_stream_metadata(stream_class, path, primary_key, name):
+    """Test that each stream class declares the correct path, primary key and name"""
+    assert (stream_class._PATH, stream_class.primary_key, stream_class.name) == (path, primary_key, name)
+
+
+def test_parse_response(jubelio_config, mock_api, products_response):
+    """Test that records are read from the data envelope"""
+    response = requests.get("https://api2.jubelio.com/products")
+    stream = Products(config=jubelio_config)
+    assert list(stream.parse_response(response)) == products_response["data"]
+
+
+def test_read_records(jubelio_config, mock_api, products_response):
+    """Test that a full refresh read returns the records of the page"""
+    stream = Products(config=jubelio_config)
+    assert list(stream.read_records(sync_mode=SyncMode.full_refresh)) == products_response["data"]
+    assert mock_api.last_request.qs == {"pagesize": ["100"], "page": ["1"]}
+    # The parsed page is released once pagination has read it
+    assert (stream._last_response, stream._last_response_json) == (None, None)
+
+
+def test_next_page_token(jubelio_config, requests_mock):
+    """Test that pages are requested until totalCount is reached"""
+    requests_mock.get("https://api2.jubelio.com/products", json={"data": [], "totalCount": 250})
+    stream = Products(config=jubelio_config)
+    tokens = []
+    for token in [None, {"page": 2}, {"page": 3}]:
+        stream.request_params({}, next_page_token=token)
+        tokens.append(stream.next_page_token(requests.get("https://api2.jubelio.com/products")))
+    assert tokens == [{"page": 2}, {"page": 3}, None]
+
+
+def test_read_records_resumes_from_checkpointed_page(jubelio_config, requests_mock):
+    """Test that a sync resumed on the last page finishes instead of moving back a page"""
+    requests_mock.get("https://api2.jubelio.com/products", json={"data": [{"id": 201}], "totalCount": 250})
+    stream = Products(config=jubelio_config)
+    stream_slice = StreamSlice(partition={}, cursor_slice={"page": 3})
+    assert list(stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=stream_slice)) == [{"id": 201}]
+    assert requests_mock.last_request.qs["page"] == ["3"]
+    assert stream.state == {"__ab_full_refresh_sync_complete": True}
\ No newline at end of file